@@ -3,44 +3,42 @@ GRAMMAR ANALYSIS
 Shows FIRST and FOLLOW sets for the grammar
 """
 
-from typing import Dict, Set
-
-
-# Simple grammar
+from table_parser import (
+    FIRST_SETS,
+    FOLLOW_SETS,
+    TABLE_HEADER,
+    TABLE_RULE,
+    compute_first_sets,
+    compute_follow_sets,
+    table_row,
+)
+from table_parser import GRAMMAR as _NUMBERED_GRAMMAR
+
+__all__ = [
+    "GRAMMAR",
+    "compute_first_sets",
+    "compute_follow_sets",
+    "print_grammar",
+    "print_first_follow",
+    "print_parsing_table",
+    "analyze_grammar",
+]
+
+# Simple grammar, in the plain list form this module has always exposed
 GRAMMAR = {
-    "S": [["if", "C", "then", "R"]],
-    "C": [["IDENTIFIER", ">=", "NUMBER"], ["IDENTIFIER", "<=", "NUMBER"]],
-    "R": [["pass"], ["fail"]],
+    nt: [list(production) for _, production in productions]
+    for nt, productions in _NUMBERED_GRAMMAR.items()
 }
 
 
-def compute_first_sets() -> Dict[str, Set[str]]:
-    """
-    FIRST(X) = What tokens can START when parsing X
-    """
-    return {
-        "S": {"if"},
-        "C": {"IDENTIFIER"},
-        "R": {"pass", "fail"},
-    }
-
-
-def compute_follow_sets() -> Dict[str, Set[str]]:
-    """
-    FOLLOW(X) = What tokens can come AFTER X
-    """
-    return {
-        "S": {"$"},
-        "C": {"then"},
-        "R": {"$"},
-    }
+_SEP = "=" * 60
 
 
 def print_grammar():
     """Print the grammar rules"""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("GRAMMAR RULES")
-    print("=" * 60)
+    print(_SEP)
     
     print("\nProductions:")
     print("  S → if C then R")
@@ -55,14 +53,13 @@ def print_grammar():
 
 def print_first_follow():
     """Print FIRST and FOLLOW sets"""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("FIRST SETS")
-    print("=" * 60)
+    print(_SEP)
     print("\nFIRST(X) = What tokens can START when parsing X")
     print()
     
-    first = compute_first_sets()
-    for nt, tokens in sorted(first.items()):
+    for nt, tokens in sorted(FIRST_SETS.items()):
         print(f"  FIRST({nt}) = {{ {', '.join(sorted(tokens))} }}")
         if nt == "S":
             print(f"      → S always starts with 'if'")
@@ -71,14 +68,13 @@ def print_first_follow():
         elif nt == "R":
             print(f"      → R can start with 'pass' OR 'fail'")
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("FOLLOW SETS")
-    print("=" * 60)
+    print(_SEP)
     print("\nFOLLOW(X) = What tokens can come AFTER X")
     print()
     
-    follow = compute_follow_sets()
-    for nt, tokens in sorted(follow.items()):
+    for nt, tokens in sorted(FOLLOW_SETS.items()):
         print(f"  FOLLOW({nt}) = {{ {', '.join(sorted(tokens))} }}")
         if nt == "S":
             print(f"      → After S comes end of input ($)")
@@ -88,19 +84,26 @@ def print_first_follow():
             print(f"      → After R comes end of input ($)")
 
 
+# Same layout as table_parser's table, but cells name the rule, not its number
+_TABLE_ROWS = (
+    table_row("S", "S→if C then R", "—", "—", "—", "—"),
+    table_row("C", "—", "—", "—", "—", "C→ID>=NUM"),
+    table_row("R", "—", "—", "R→pass", "R→fail", "—"),
+)
+
+
 def print_parsing_table():
     """Print the parsing table"""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("LL(1) PARSING TABLE")
-    print("=" * 60)
+    print(_SEP)
     print("\nHow to use: Table[Non-Terminal, Token] = Which rule to apply")
     print()
     
-    print(f"{'NT':<4}| {'if':<15} {'then':<15} {'pass':<15} {'fail':<15} {'ID':<15}")
-    print("-" * 80)
-    print(f"{'S':<4}| {'S→if C then R':<15} {'—':<15} {'—':<15} {'—':<15} {'—':<15}")
-    print(f"{'C':<4}| {'—':<15} {'—':<15} {'—':<15} {'—':<15} {'C→ID>=NUM':<15}")
-    print(f"{'R':<4}| {'—':<15} {'—':<15} {'R→pass':<15} {'R→fail':<15} {'—':<15}")
+    print(TABLE_HEADER)
+    print(TABLE_RULE)
+    for row in _TABLE_ROWS:
+        print(row)
     
     print("\nExplanation:")
     print("  • When parsing S and see 'if' → Use rule: S → if C then R")
@@ -111,17 +114,17 @@ def print_parsing_table():
 
 def analyze_grammar():
     """Run complete grammar analysis"""
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("GRAMMAR ANALYSIS")
-    print("=" * 60)
+    print(_SEP)
     
     print_grammar()
     print_first_follow()
     print_parsing_table()
     
-    print("\n" + "=" * 60)
+    print("\n" + _SEP)
     print("SUMMARY")
-    print("=" * 60)
+    print(_SEP)
     print("""
 This grammar is LL(1) which means:
   • L = Scan input Left-to-right
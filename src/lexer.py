@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
 from enum import Enum, auto
-from typing import Optional, List
+from typing import List, NamedTuple
 
 
 class TokenType(Enum):
@@ -20,8 +20,18 @@ class TokenType(Enum):
     EOF = auto()
 
 
-@dataclass
-class Token:
+# One alternative per lexeme; unnamed whitespace runs are skipped
+_TOKEN_RE = re.compile(
+    r"\s+"
+    r"|(?P<GTE>>=)"
+    r"|(?P<LTE><=)"
+    r"|(?P<WORD>[A-Za-z]+)"
+    r"|(?P<NUMBER>[0-9]+)"
+    r"|(?P<BAD>.)"
+)
+
+
+class Token(NamedTuple):
     type: TokenType
     value: str = ""
     
@@ -43,75 +53,72 @@ class Lexer:
     
     ALLOWED_NUMBERS = {"90"}
     
+    # Tokens are immutable, so fixed lexemes share a single instance
+    _KEYWORD_TOKENS = {
+        word: Token(token_type, word) for word, token_type in KEYWORDS.items()
+    }
+    _GTE_TOKEN = Token(TokenType.GTE, ">=")
+    _LTE_TOKEN = Token(TokenType.LTE, "<=")
+    _EOF_TOKEN = Token(TokenType.EOF)
+    
     def __init__(self, source: str):
         self.source = source
         self.pos = 0
         self.tokens: List[Token] = []
     
-    def current_char(self) -> Optional[str]:
-        if self.pos >= len(self.source):
-            return None
-        return self.source[self.pos]
-    
-    def advance(self):
-        self.pos += 1
-    
-    def skip_whitespace(self):
-        while self.current_char() and self.current_char().isspace():
-            self.advance()
-    
-    def read_word(self) -> str:
-        result = ""
-        while self.current_char() and self.current_char().isalpha():
-            result += self.current_char()
-            self.advance()
-        return result
-    
-    def read_number(self) -> str:
-        result = ""
-        while self.current_char() and self.current_char().isdigit():
-            result += self.current_char()
-            self.advance()
-        return result
-    
     def tokenize(self) -> List[Token]:
-        while self.current_char() is not None:
-            self.skip_whitespace()
-            
-            if self.current_char() is None:
-                break
+        # Bind everything the loop touches to locals once
+        append = self.tokens.append
+        keyword_tokens = self._KEYWORD_TOKENS
+        keywords = self.KEYWORDS
+        identifiers = self.ALLOWED_IDENTIFIERS
+        numbers = self.ALLOWED_NUMBERS
+        gte_token = self._GTE_TOKEN
+        lte_token = self._LTE_TOKEN
+        
+        for match in _TOKEN_RE.finditer(self.source):
+            kind = match.lastgroup
+            if kind is None:
+                continue
             
-            char = self.current_char()
+            text = match.group()
             
-            if char == ">" and self.pos + 1 < len(self.source) and self.source[self.pos + 1] == "=":
-                self.tokens.append(Token(TokenType.GTE, ">="))
-                self.advance()
-                self.advance()
-            elif char == "<" and self.pos + 1 < len(self.source) and self.source[self.pos + 1] == "=":
-                self.tokens.append(Token(TokenType.LTE, "<="))
-                self.advance()
-                self.advance()
+            if kind == "GTE":
+                append(gte_token)
+            elif kind == "LTE":
+                append(lte_token)
             
-            elif char.isalpha():
-                word = self.read_word()
-                
-                if word.lower() in self.KEYWORDS:
-                    self.tokens.append(Token(self.KEYWORDS[word.lower()], word))
-                else:
-                    if word not in self.ALLOWED_IDENTIFIERS:
-                        raise SyntaxError(f"Invalid identifier '{word}'. Only 'score' is allowed.")
-                    self.tokens.append(Token(TokenType.IDENTIFIER, word))
+            elif kind == "WORD":
+                # Keywords are case-insensitive, but source is almost always
+                # lowercase: try the exact word before allocating .lower()
+                token = keyword_tokens.get(text)
+                if token is None:
+                    keyword = keywords.get(text.lower())
+                    if keyword is not None:
+                        token = Token(keyword, text)
+                    elif text in identifiers:
+                        token = Token(TokenType.IDENTIFIER, text)
+                    else:
+                        raise SyntaxError(
+                            f"Invalid identifier '{text}'. Only 'score' is allowed."
+                        )
+                append(token)
             
-            elif char.isdigit():
-                number = self.read_number()
-                if number not in self.ALLOWED_NUMBERS:
-                    raise SyntaxError(f"Invalid number '{number}'. Only 50 and 90 are allowed.")
-                self.tokens.append(Token(TokenType.NUMBER, number))
+            elif kind == "NUMBER":
+                if text not in numbers:
+                    raise SyntaxError(
+                        f"Invalid number '{text}'. Only 50 and 90 are allowed."
+                    )
+                append(Token(TokenType.NUMBER, text))
             
             else:
-                raise SyntaxError(f"Unexpected character: '{char}' at position {self.pos}")
+                self.pos = match.start()
+                raise SyntaxError(
+                    f"Unexpected character: '{text}' at position {self.pos}"
+                )
         
-        self.tokens.append(Token(TokenType.EOF))
+        self.pos = len(self.source)
+        append(self._EOF_TOKEN)
         return self.tokens
 
 
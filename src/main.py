@@ -1,60 +1,92 @@
+import functools
+import io
+import sys
+from typing import Optional, TextIO, Tuple
+
 from lexer import Lexer
-from table_parser import build_parsing_table, print_parsing_table
+from table_parser import TableDrivenParser, format_parsing_table
+
+_BANNER = "=" * 80
+_DIVIDER = "-" * 80
+_HEADER = f"\n{_BANNER}\nCOMPILER - Theory of Computation\n{_BANNER}\n\nInput: "
+
 
+# The grammar is fixed, so the printed table only needs building once
+@functools.lru_cache(maxsize=1)
+def _parsing_table_text() -> str:
+    return format_parsing_table()
 
-def compile_with_validation(source: str) -> bool:
-    print("\n" + "=" * 80)
-    print("COMPILER - Theory of Computation")
-    print("=" * 80)
-    print(f"\nInput: {source}")
+
+def compile_with_validation(source: str, verbose: bool = False) -> bool:
+    if not verbose:
+        return _compile(source, None)
     
-    print("\n" + "=" * 80)
-    print("STEP 1: LL(1) PARSING TABLE")
-    print("=" * 80)
-    table = build_parsing_table()
-    print_parsing_table(table)
+    is_valid, report = _compile_report(source)
+    sys.stdout.write(f"{_HEADER}{source}\n{report}")
+    return is_valid
+
+
+# Collect the whole report so it is written to stdout in one go; repeated
+# inputs (e.g. 'example' in the REPL) replay the cached report
+@functools.lru_cache(maxsize=64)
+def _compile_report(source: str) -> Tuple[bool, str]:
+    out = io.StringIO()
+    is_valid = _compile(source, out)
+    return is_valid, out.getvalue()
+
+
+def _compile(source: str, out: Optional[TextIO]) -> bool:
+    verbose = out is not None
+    if verbose:
+        print("\n" + _BANNER, file=out)
+        print("STEP 1: LL(1) PARSING TABLE", file=out)
+        print(_BANNER, file=out)
+        print(_parsing_table_text(), file=out)
     
     try:
         lexer = Lexer(source)
         tokens = lexer.tokenize()
     except SyntaxError as e:
-        print(f"\n✗ LEXICAL ERROR: {e}")
-        print("\n" + "=" * 80)
-        print("COMPILATION FAILED - Invalid token in input")
-        print("=" * 80)
+        if verbose:
+            print(f"\n✗ LEXICAL ERROR: {e}", file=out)
+            print("\n" + _BANNER, file=out)
+            print("COMPILATION FAILED - Invalid token in input", file=out)
+            print(_BANNER, file=out)
         return False
     
-    print("\n" + "=" * 80)
-    print("STEP 2: SYNTAX ANALYSIS (Table-Driven Parsing)")
-    print("=" * 80)
+    if verbose:
+        print("\n" + _BANNER, file=out)
+        print("STEP 2: SYNTAX ANALYSIS (Table-Driven Parsing)", file=out)
+        print(_BANNER, file=out)
     
-    from table_parser import TableDrivenParser
-    table_parser = TableDrivenParser(tokens, show_steps=True)
+    table_parser = TableDrivenParser(tokens, show_steps=verbose, out=out)
     is_valid = table_parser.parse()
     
     if not is_valid:
-        print("\n" + "=" * 80)
-        print("✗ COMPILATION FAILED - Syntax errors:")
-        print("=" * 80)
-        for error in table_parser.get_errors():
-            print(f"  • {error}")
-        print("\nThe input does not conform to the grammar.")
-        print("Please check your syntax and try again.")
+        if verbose:
+            print("\n" + _BANNER, file=out)
+            print("✗ COMPILATION FAILED - Syntax errors:", file=out)
+            print(_BANNER, file=out)
+            for error in table_parser.get_errors():
+                print(f"  • {error}", file=out)
+            print("\nThe input does not conform to the grammar.", file=out)
+            print("Please check your syntax and try again.", file=out)
         return False
     
-    print("\n" + "=" * 80)
-    print("✓ COMPILATION SUCCESSFUL!")
-    print("=" * 80)
-    print("\nThe input is valid and conforms to the grammar.")
+    if verbose:
+        print("\n" + _BANNER, file=out)
+        print("✓ COMPILATION SUCCESSFUL!", file=out)
+        print(_BANNER, file=out)
+        print("\nThe input is valid and conforms to the grammar.", file=out)
     
     return True
 
 
 def interactive_mode():
-    print("\n" + "=" * 80)
+    print("\n" + _BANNER)
     print("INTERACTIVE COMPILER")
     print("Theory of Computation - Grammar-Based Compiler")
-    print("=" * 80)
+    print(_BANNER)
     
     print("""
 Minimal Grammar:
@@ -80,7 +112,7 @@ Type 'grammar' to run grammar analysis.
 """)
     
     while True:
-        print("\n" + "-" * 80)
+        print("\n" + _DIVIDER)
         try:
             source = input("Enter your code (or 'quit'): ").strip()
         except (EOFError, KeyboardInterrupt):
@@ -103,15 +135,13 @@ Type 'grammar' to run grammar analysis.
             analyze_grammar()
             continue
         
-        compile_with_validation(source)
+        compile_with_validation(source, verbose=True)
 
 
 def main():
-    import sys
-    
     if len(sys.argv) > 1:
         source = " ".join(sys.argv[1:])
-        compile_with_validation(source)
+        compile_with_validation(source, verbose=True)
     else:
         interactive_mode()
 
@@ -1,28 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, List
+from typing import List, NamedTuple
+
 from lexer import Lexer, Token, TokenType
 
 
-@dataclass
-class ResultNode:
+class ResultNode(NamedTuple):
     result: str
 
 
-@dataclass
-class ConditionNode:
+class ConditionNode(NamedTuple):
     identifier: str
     operator: str
     number: int
 
 
-@dataclass
-class IfStatementNode:
+class IfStatementNode(NamedTuple):
     condition: ConditionNode
     result: ResultNode
 
 
+# Token types accepted at the two branching points of the grammar
+_OPERATORS = {TokenType.GTE: ">=", TokenType.LTE: "<="}
+_RESULTS = {TokenType.PASS: "pass", TokenType.FAIL: "fail"}
+
+
 class Parser:
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
@@ -32,7 +34,7 @@ class Parser:
         return self.tokens[self.pos]
     
     def consume(self, expected_type: TokenType) -> Token:
-        token = self.current_token()
+        token = self.tokens[self.pos]
         if token.type != expected_type:
             raise SyntaxError(
                 f"Expected {expected_type.name}, got {token.type.name} at position {self.pos}"
@@ -42,8 +44,9 @@ class Parser:
     
     def parse(self) -> IfStatementNode:
         statement = self.parse_statement()
-        if self.current_token().type != TokenType.EOF:
-            raise SyntaxError(f"Unexpected token after statement: {self.current_token().type.name}")
+        current = self.tokens[self.pos]
+        if current.type != TokenType.EOF:
+            raise SyntaxError(f"Unexpected token after statement: {current.type.name}")
         return statement
     
     def parse_statement(self) -> IfStatementNode:
@@ -57,30 +60,23 @@ class Parser:
     def parse_condition(self) -> ConditionNode:
         id_token = self.consume(TokenType.IDENTIFIER)
         
-        current = self.current_token()
-        if current.type == TokenType.GTE:
-            operator = ">="
-            self.consume(TokenType.GTE)
-        elif current.type == TokenType.LTE:
-            operator = "<="
-            self.consume(TokenType.LTE)
-        else:
+        current = self.tokens[self.pos]
+        operator = _OPERATORS.get(current.type)
+        if operator is None:
             raise SyntaxError(f"Expected >= or <=, got {current.type.name}")
+        self.pos += 1
         
         num_token = self.consume(TokenType.NUMBER)
         
         return ConditionNode(id_token.value, operator, int(num_token.value))
     
     def parse_result(self) -> ResultNode:
-        current = self.current_token()
-        if current.type == TokenType.PASS:
-            self.consume(TokenType.PASS)
-            return ResultNode("pass")
-        elif current.type == TokenType.FAIL:
-            self.consume(TokenType.FAIL)
-            return ResultNode("fail")
-        else:
+        current = self.tokens[self.pos]
+        result = _RESULTS.get(current.type)
+        if result is None:
             raise SyntaxError(f"Expected 'pass' or 'fail', got {current.type.name}")
+        self.pos += 1
+        return ResultNode(result)
 
 
 if __name__ == "__main__":
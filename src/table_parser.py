@@ -3,15 +3,22 @@ SIMPLE TABLE-DRIVEN PARSER
 With FIRST and FOLLOW sets explained simply
 """
 
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, TextIO, Tuple
 from lexer import Token, TokenType
 
 
-# Grammar rules
+# Grammar rules (immutable: the tables below are derived from them once)
 GRAMMAR = {
-    "S": [(1, ["if", "C", "then", "R"])],
-    "C": [(2, ["IDENTIFIER", ">=", "NUMBER"]), (3, ["IDENTIFIER", "<=", "NUMBER"])],
-    "R": [(4, ["pass"]), (5, ["fail"])],
+    "S": ((1, ("if", "C", "then", "R")),),
+    "C": ((2, ("IDENTIFIER", ">=", "NUMBER")), (3, ("IDENTIFIER", "<=", "NUMBER"))),
+    "R": ((4, ("pass",)), (5, ("fail",))),
+}
+
+# Rule number -> production, shared by every table built from GRAMMAR
+PRODUCTIONS = {
+    rule_num: production
+    for productions in GRAMMAR.values()
+    for rule_num, production in productions
 }
 
 # Token to terminal mapping
@@ -27,6 +34,12 @@ TOKEN_MAP = {
     TokenType.EOF: "$",
 }
 
+# Symbol kinds, checked on every parser step
+TERMINALS = frozenset(
+    {"if", "then", "pass", "fail", ">=", "<=", "IDENTIFIER", "NUMBER"}
+)
+NON_TERMINALS = frozenset(GRAMMAR)
+
 
 def compute_first_sets() -> Dict[str, Set[str]]:
     """
@@ -60,79 +73,142 @@ def compute_follow_sets() -> Dict[str, Set[str]]:
     }
 
 
-def build_parsing_table() -> Dict[Tuple[str, str], Tuple[int, List[str]]]:
+# A table cell: rule number, production, and the production reversed so it
+# can be pushed onto the parse stack in one go
+TableEntry = Tuple[int, Tuple[str, ...], Tuple[str, ...]]
+
+
+def _table_entry(rule_num: int) -> TableEntry:
+    production = PRODUCTIONS[rule_num]
+    return rule_num, production, production[::-1]
+
+
+def build_parsing_table() -> Dict[str, Dict[str, TableEntry]]:
     """
     Build parsing table using FIRST and FOLLOW
     
     Rule: For each production A → α
-    - If token 't' is in FIRST(α), put the rule in table[A, t]
+    - If token 't' is in FIRST(α), put the rule in table[A][t]
     
     Example:
-    - S → if C then R, FIRST = {if}, so table[S, if] = this rule
-    - R → pass, FIRST = {pass}, so table[R, pass] = this rule
+    - S → if C then R, FIRST = {if}, so table[S][if] = this rule
+    - R → pass, FIRST = {pass}, so table[R][pass] = this rule
     """
-    table = {}
+    table = {nt: {} for nt in GRAMMAR}
     
     # Rule 1: S → if C then R (starts with "if")
-    table[("S", "if")] = (1, ["if", "C", "then", "R"])
+    table["S"]["if"] = _table_entry(1)
     
     # Rule 2: C → IDENTIFIER >= NUMBER (starts with IDENTIFIER)
-    table[("C", "IDENTIFIER")] = (2, ["IDENTIFIER", ">=", "NUMBER"])
+    table["C"]["IDENTIFIER"] = _table_entry(2)
     
     # Rule 3: C → IDENTIFIER <= NUMBER (also starts with IDENTIFIER)
     # We'll handle this specially in the parser
     
     # Rule 4: R → pass (starts with "pass")
-    table[("R", "pass")] = (4, ["pass"])
+    table["R"]["pass"] = _table_entry(4)
     
     # Rule 5: R → fail (starts with "fail")
-    table[("R", "fail")] = (5, ["fail"])
+    table["R"]["fail"] = _table_entry(5)
     
     return table
 
 
+# The grammar is fixed, so its analysis is done once at import
+FIRST_SETS = compute_first_sets()
+FOLLOW_SETS = compute_follow_sets()
+PARSING_TABLE = build_parsing_table()
+# C → IDENTIFIER >= NUMBER | IDENTIFIER <= NUMBER, picked by the terminal
+# after IDENTIFIER; anything but <= falls back to rule 2
+_C_GTE_ENTRY = PARSING_TABLE["C"]["IDENTIFIER"]
+_C_DISPATCH = {"<=": _table_entry(3)}
+
+
+def table_row(label: str, *cells: str) -> str:
+    """Format one row of the printed parsing table"""
+    return label.ljust(4) + "| " + " ".join(cell.ljust(15) for cell in cells)
+
+
+# Printed table layout, formatted once
+TABLE_HEADER = table_row("NT", "if", "then", "pass", "fail", "ID")
+TABLE_RULE = "-" * 80
+_TABLE_ROWS = (
+    table_row("S", "1:if C then R", "—", "—", "—", "—"),
+    table_row("C", "—", "—", "—", "—", "2:ID>=NUM"),
+    table_row("R", "—", "—", "4:pass", "5:fail", "—"),
+)
+# Display text for each rule, formatted once
+_RULE_LINES = tuple(
+    f"  {rule_num}. {nt} → {' '.join(prod)}"
+    for nt, productions in GRAMMAR.items()
+    for rule_num, prod in productions
+)
+_APPLY_ACTIONS = {
+    rule_num: f"Apply {rule_num}: {nt}→{' '.join(prod)}"
+    for nt, productions in GRAMMAR.items()
+    for rule_num, prod in productions
+}
+
+_STEP_ROW = "{:<6}{:<30}{:<25}{:<30}".format
+_STEP_HEADER = "\n" + _STEP_ROW("Step", "Stack", "Input", "Action")
+_STEP_RULE = "-" * 91
+
+
+def format_parsing_table() -> str:
+    """Render the grammar, FIRST/FOLLOW sets and parsing table as text"""
+    lines = [
+        "",
+        "Grammar:",
+        "  S → if C then R",
+        "  C → IDENTIFIER >= NUMBER | IDENTIFIER <= NUMBER",
+        "  R → pass | fail",
+        "",
+    ]
+    
+    lines.append("FIRST Sets (what can START each rule):")
+    for nt, tokens in FIRST_SETS.items():
+        lines.append(f"  FIRST({nt}) = {{{', '.join(tokens)}}}")
+    lines.append("")
+    
+    lines.append("FOLLOW Sets (what can come AFTER each rule):")
+    for nt, tokens in FOLLOW_SETS.items():
+        lines.append(f"  FOLLOW({nt}) = {{{', '.join(tokens)}}}")
+    lines.append("")
+    
+    lines.append("Parsing Table:")
+    lines.append(TABLE_HEADER)
+    lines.append(TABLE_RULE)
+    lines.extend(_TABLE_ROWS)
+    lines.append("")
+    
+    lines.append("Production Rules:")
+    lines.extend(_RULE_LINES)
+    
+    return "\n".join(lines)
+
+
 def print_parsing_table(table):
     """Print the parsing table nicely"""
-    print("\nGrammar:")
-    print("  S → if C then R")
-    print("  C → IDENTIFIER >= NUMBER | IDENTIFIER <= NUMBER")
-    print("  R → pass | fail")
-    print()
-    
-    print("FIRST Sets (what can START each rule):")
-    first = compute_first_sets()
-    for nt, tokens in first.items():
-        print(f"  FIRST({nt}) = {{{', '.join(tokens)}}}")
-    print()
-    
-    print("FOLLOW Sets (what can come AFTER each rule):")
-    follow = compute_follow_sets()
-    for nt, tokens in follow.items():
-        print(f"  FOLLOW({nt}) = {{{', '.join(tokens)}}}")
-    print()
-    
-    print("Parsing Table:")
-    print(f"{'NT':<4}| {'if':<15} {'then':<15} {'pass':<15} {'fail':<15} {'ID':<15}")
-    print("-" * 80)
-    print(f"{'S':<4}| {'1:if C then R':<15} {'—':<15} {'—':<15} {'—':<15} {'—':<15}")
-    print(f"{'C':<4}| {'—':<15} {'—':<15} {'—':<15} {'—':<15} {'2:ID>=NUM':<15}")
-    print(f"{'R':<4}| {'—':<15} {'—':<15} {'4:pass':<15} {'5:fail':<15} {'—':<15}")
-    print()
-    
-    print("Production Rules:")
-    for nt, productions in GRAMMAR.items():
-        for rule_num, prod in productions:
-            print(f"  {rule_num}. {nt} → {' '.join(prod)}")
+    print(format_parsing_table())
 
 
 class TableDrivenParser:
     """Simple parser using the parsing table"""
     
-    def __init__(self, tokens: List[Token], show_steps: bool = True):
+    def __init__(
+        self,
+        tokens: List[Token],
+        show_steps: bool = True,
+        out: Optional[TextIO] = None,
+    ):
+        self.show_steps = show_steps
+        self.out = out  # where steps are printed; None means stdout
+        self.table = PARSING_TABLE
         self.tokens = tokens
         self.pos = 0
-        self.show_steps = show_steps
-        self.table = build_parsing_table()
+        # Terminal name of every token, mapped once; the trailing "$" stands
+        # in for reading past the end of the token list
+        self.terminals = [self.token_to_terminal(t) for t in tokens] + ["$"]
         self.stack = ["$", "S"]  # Start with end marker and start symbol
         self.errors = []
     
@@ -146,76 +222,96 @@ class TableDrivenParser:
     
     def parse(self) -> bool:
         """Parse using the table"""
-        if self.show_steps:
-            print(f"\n{'Step':<6}{'Stack':<30}{'Input':<25}{'Action':<30}")
-            print("-" * 91)
+        if not self.show_steps:
+            return self._parse(None)
+        
+        # Collect the trace and print it with a single call
+        steps = [_STEP_HEADER, _STEP_RULE]
+        is_valid = self._parse(steps)
+        print("\n".join(steps), file=self.out)
+        return is_valid
+    
+    def _parse(self, steps: Optional[List[str]]) -> bool:
+        # The stack and lookahead change on every step; the rest is fixed
+        stack = self.stack
+        pop = stack.pop
+        extend = stack.extend
+        table = self.table
+        terminals = self.terminals
+        terminal_symbols = TERMINALS
+        non_terminal_symbols = NON_TERMINALS
+        show_steps = steps is not None
+        
+        # Lookahead only changes when a terminal is matched
+        terminal = terminals[self.pos]
         
         step = 0
-        while self.stack:
+        while stack:
             step += 1
-            top = self.stack[-1]
-            current = self.current_token()
-            terminal = self.token_to_terminal(current)
+            top = stack[-1]
             
             # Format for display
-            stack_str = " ".join(reversed(self.stack))
-            input_tokens = [self.token_to_terminal(t) for t in self.tokens[self.pos:]]
-            input_str = " ".join(input_tokens[:4])
-            if len(input_tokens) > 4:
-                input_str += "..."
+            if show_steps:
+                stack_str = " ".join(reversed(stack))
+                remaining = len(self.tokens) - self.pos
+                input_str = " ".join(terminals[self.pos:self.pos + min(remaining, 4)])
+                if remaining > 4:
+                    input_str += "..."
             
             # Case 1: End of stack
             if top == "$":
                 if terminal == "$":
-                    if self.show_steps:
-                        print(f"{step:<6}{stack_str:<30}{input_str:<25}{'✓ ACCEPT':<30}")
+                    if show_steps:
+                        steps.append(_STEP_ROW(step, stack_str, input_str, "✓ ACCEPT"))
                     return True
                 else:
-                    self.errors.append(f"Unexpected token '{current.value}'")
+                    value = self.current_token().value
+                    self.errors.append(f"Unexpected token '{value}'")
                     return False
             
             # Case 2: Terminal on stack - must match input
-            elif top in ["if", "then", "pass", "fail", ">=", "<=", "IDENTIFIER", "NUMBER"]:
+            elif top in terminal_symbols:
                 if top == terminal:
-                    if self.show_steps:
-                        print(f"{step:<6}{stack_str:<30}{input_str:<25}{'Match ' + top:<30}")
-                    self.stack.pop()
+                    if show_steps:
+                        action = "Match " + top
+                        steps.append(_STEP_ROW(step, stack_str, input_str, action))
+                    pop()
                     self.pos += 1
+                    terminal = terminals[self.pos]
                 else:
-                    self.errors.append(f"Expected '{top}', got '{current.value}'")
+                    value = self.current_token().value
+                    self.errors.append(f"Expected '{top}', got '{value}'")
                     return False
             
             # Case 3: Non-terminal on stack - look up in table
-            elif top in ["S", "C", "R"]:
+            elif top in non_terminal_symbols:
                 # Special case: C can be >= or <=, check next token
                 if top == "C" and terminal == "IDENTIFIER":
-                    next_token = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else None
-                    if next_token and next_token.type == TokenType.LTE:
-                        rule_num, production = 3, ["IDENTIFIER", "<=", "NUMBER"]
-                    else:
-                        rule_num, production = 2, ["IDENTIFIER", ">=", "NUMBER"]
+                    # IDENTIFIER is not the trailing "$", so pos + 1 is in range
+                    next_terminal = terminals[self.pos + 1]
+                    rule_num, _, reversed_production = _C_DISPATCH.get(
+                        next_terminal, _C_GTE_ENTRY
+                    )
                     
-                    if self.show_steps:
-                        prod_str = " ".join(production)
-                        print(f"{step:<6}{stack_str:<30}{input_str:<25}{f'Apply {rule_num}: {top}→{prod_str}':<30}")
+                    if show_steps:
+                        action = _APPLY_ACTIONS[rule_num]
+                        steps.append(_STEP_ROW(step, stack_str, input_str, action))
                     
-                    self.stack.pop()
-                    for symbol in reversed(production):
-                        self.stack.append(symbol)
+                    pop()
+                    extend(reversed_production)
                 else:
                     # Look up in table
-                    entry = self.table.get((top, terminal))
+                    entry = table[top].get(terminal)
                     if entry:
-                        rule_num, production = entry
-                        if self.show_steps:
-                            prod_str = " ".join(production)
-                            print(f"{step:<6}{stack_str:<30}{input_str:<25}{f'Apply {rule_num}: {top}→{prod_str}':<30}")
+                        rule_num, _, reversed_production = entry
+                        if show_steps:
+                            action = _APPLY_ACTIONS[rule_num]
+                            steps.append(_STEP_ROW(step, stack_str, input_str, action))
                         
-                        self.stack.pop()
-                        for symbol in reversed(production):
-                            self.stack.append(symbol)
+                        pop()
+                        extend(reversed_production)
                     else:
-                        self.errors.append(f"Unexpected '{current.value}'")
+                        self.errors.append(f"Unexpected '{self.current_token().value}'")
                         return False
             else:
                 self.errors.append(f"Unknown symbol: {top}")
@@ -237,8 +333,7 @@ if __name__ == "__main__":
     lexer = Lexer("if score >= 90 then pass")
     tokens = lexer.tokenize()
     
-    table = build_parsing_table()
-    print_parsing_table(table)
+    print_parsing_table(PARSING_TABLE)
     
     parser = TableDrivenParser(tokens)
     result = parser.parse()
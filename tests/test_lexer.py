@@ -0,0 +1,39 @@
+import pytest
+
+from src.lexer import Lexer, Token, TokenType
+
+
+def test_keywords_are_case_insensitive():
+    tokens = Lexer("IF score >= 90 Then PASS").tokenize()
+    assert [t.type for t in tokens] == [
+        TokenType.IF,
+        TokenType.IDENTIFIER,
+        TokenType.GTE,
+        TokenType.NUMBER,
+        TokenType.THEN,
+        TokenType.PASS,
+        TokenType.EOF,
+    ]
+    assert tokens[0] == Token(TokenType.IF, "IF")
+
+
+def test_comparison_operators():
+    assert Lexer("score>=90").tokenize()[1] == Token(TokenType.GTE, ">=")
+    assert Lexer("score <= 90").tokenize()[1] == Token(TokenType.LTE, "<=")
+
+
+def test_lone_operator_reports_its_position():
+    lexer = Lexer("if score > 90 then pass")
+    with pytest.raises(SyntaxError, match="Unexpected character: '>' at position 9"):
+        lexer.tokenize()
+    assert lexer.pos == 9
+
+
+def test_invalid_identifier():
+    with pytest.raises(SyntaxError, match="Invalid identifier 'grade'"):
+        Lexer("if grade >= 90 then pass").tokenize()
+
+
+def test_invalid_number():
+    with pytest.raises(SyntaxError, match="Invalid number '50'"):
+        Lexer("if score >= 50 then pass").tokenize()
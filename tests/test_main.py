@@ -1,7 +1,62 @@
-from src.main import main
+from src.main import compile_with_validation, main
 
 
 def test_main(capsys):
     main()
     captured = capsys.readouterr()
     assert captured.out == "Hello, World!\n"
+
+
+VALID = "if score >= 90 then pass"
+LEXICALLY_INVALID = "if x >= 90 then pass"
+SYNTACTICALLY_INVALID = "if score >= 90 then"
+
+
+def test_compile_is_silent_by_default(capsys):
+    assert compile_with_validation(VALID) is True
+    assert compile_with_validation("if score <= 90 then fail") is True
+    assert compile_with_validation(LEXICALLY_INVALID) is False
+    assert compile_with_validation(SYNTACTICALLY_INVALID) is False
+    assert capsys.readouterr().out == ""
+
+
+def test_verbose_compile_reports_success(capsys):
+    assert compile_with_validation(VALID, verbose=True) is True
+    out = capsys.readouterr().out
+    assert out.startswith(
+        "\n" + "=" * 80 + "\nCOMPILER - Theory of Computation\n" + "=" * 80
+        + "\n\nInput: if score >= 90 then pass\n"
+    )
+    assert "STEP 1: LL(1) PARSING TABLE" in out
+    assert "STEP 2: SYNTAX ANALYSIS (Table-Driven Parsing)" in out
+    assert "Apply 2: C→IDENTIFIER >= NUMBER" in out
+    assert "✓ ACCEPT" in out
+    assert out.endswith(
+        "✓ COMPILATION SUCCESSFUL!\n" + "=" * 80
+        + "\n\nThe input is valid and conforms to the grammar.\n"
+    )
+
+
+def test_verbose_compile_reports_lexical_error(capsys):
+    assert compile_with_validation(LEXICALLY_INVALID, verbose=True) is False
+    out = capsys.readouterr().out
+    assert (
+        "✗ LEXICAL ERROR: Invalid identifier 'x'. Only 'score' is allowed." in out
+    )
+    assert "COMPILATION FAILED - Invalid token in input" in out
+    assert "STEP 2" not in out
+
+
+def test_verbose_compile_reports_syntax_error(capsys):
+    assert compile_with_validation(SYNTACTICALLY_INVALID, verbose=True) is False
+    out = capsys.readouterr().out
+    assert "✗ COMPILATION FAILED - Syntax errors:" in out
+    assert "  • Unexpected ''" in out
+    assert out.endswith("Please check your syntax and try again.\n")
+
+
+def test_verbose_compile_repeats_identical_output(capsys):
+    compile_with_validation("if score <= 90 then fail", verbose=True)
+    first = capsys.readouterr().out
+    compile_with_validation("if score <= 90 then fail", verbose=True)
+    assert capsys.readouterr().out == first